@@ -2,7 +2,8 @@
 
 from typing import Optional, Union
 
-from pandas import DataFrame, NamedAgg, Series, concat
+from numpy.typing import NDArray
+from pandas import DataFrame, MultiIndex, NamedAgg, Series, concat
 from sklearn.base import BaseEstimator, TransformerMixin
 
 from categorical_encoder.smoothing import SmoothingFnType, step_function
@@ -35,8 +36,10 @@ def __init__(
         agg_fn : Union[str, NamedAgg]
             The aggregation function to use for encoding. This can be a string
             (eg "mean", "median", "sum", etc.) or a NamedAgg object.
-        smoothing_fn: Callable[[Series, Series, Series], Series]
+        smoothing_fn: Callable[[NDArray, NDArray, NDArray], NDArray]
             A function that interpolates between the current encoding and the prior.
+            It receives the encoding, number of samples and prior of every category
+            in a level as NumPy arrays, and must return a NumPy array.
             The minimum number of samples required to calculate the encoding
             should be passed to the function.
         target_col : str
@@ -84,33 +87,33 @@ def fit(
             self.agg_fn,
         ]
 
-        # Base case: the first level of encoding is just the target column aggregated
-        level_0 = data.groupby("_l0_", as_index=False)[[self._target_col]].agg(aggs)
-        level_0.columns = ["_l0_", "count", self.agg_fn.column]
-        level_0 = level_0.drop(["count"], axis=1)
-        prior = level_0
-        levels = [level_0]
-
-        # If there are multiple levels, we need to iterate through each
-        # level using the level before it as an encoding prior.
-        # We can do this by calculating the encoding for each level and
-        # interpolating the prior encoding when necessary.
+        # Aggregate every level of the hierarchy, and find the index of each
+        # node's parent in the level above.
+        # The first level is just the target column aggregated.
         columns = ["_l0_", *self.columns]
-        for i, _ in enumerate(self.columns):
-            encoding = data.groupby(columns[: i + 2], as_index=False)[
+        levels = []
+        parents = []
+        for i, _ in enumerate(columns):
+            encoding = data.groupby(columns[: i + 1], as_index=False)[
                 self._target_col
             ].agg(aggs)
-            merged = _merge_levels(
-                prior,
-                encoding,
-                columns[: i + 1],
-                columns[i + 1],
-                self.agg_fn,
-                self.smoothing_fn,
-            )
-            prior = merged
-            levels.append(merged)
-
+            if levels:
+                parents.append(_parent_index(levels[-1], encoding, columns[:i]))
+
+            levels.append(encoding)
+
+        # Smooth all levels in a single top-down sweep, using the smoothed
+        # encoding of each node's parent as its prior.
+        smoothed = _smooth_levels(
+            [level[self.agg_fn.column].to_numpy() for level in levels],
+            [level["count"].to_numpy() for level in levels],
+            parents,
+            self.smoothing_fn,
+        )
+        for level, values in zip(levels, smoothed):
+            level[self.agg_fn.column] = values
+
+        levels = [level.drop(["count"], axis=1) for level in levels]
         self._levels = levels
 
         return self
@@ -159,26 +162,32 @@ def transform(self, X: DataFrame) -> DataFrame:
         return data
 
 
-def _merge_levels(
+def _parent_index(
     prior: DataFrame,
     current: DataFrame,
     on: list[str],
-    current_level: str,
-    agg_fn: NamedAgg,
-    smoothing_fn: SmoothingFnType,
-) -> DataFrame:
-    """Merge two levels of encoding."""
-    merged = prior.merge(
-        current,
-        how="left",
-        on=on,
-        suffixes=("_prior", ""),
+) -> NDArray:
+    """Find the position in the prior level of each node's parent."""
+    parent = MultiIndex.from_frame(prior[on]).get_indexer(
+        MultiIndex.from_frame(current[on]),
     )
+    if (parent < 0).any():
+        msg = "every node must have a parent in the level above"
+        raise ValueError(msg)
+
+    return parent
 
-    merged[agg_fn.column] = smoothing_fn(
-        merged[agg_fn.column],
-        merged["count"],
-        merged[agg_fn.column + "_prior"],
-    )
 
-    return merged[[*on, current_level, agg_fn.column]]
+def _smooth_levels(
+    encodings: list[NDArray],
+    counts: list[NDArray],
+    parents: list[NDArray],
+    smoothing_fn: SmoothingFnType,
+) -> list[NDArray]:
+    """Smooth each level of encoding towards the smoothed encoding of its parent."""
+    smoothed = [encodings[0]]
+    for encoding, count, parent in zip(encodings[1:], counts[1:], parents):
+        prior = smoothed[-1][parent]
+        smoothed.append(smoothing_fn(encoding, count, prior))
+
+    return smoothed
@@ -2,30 +2,31 @@
 
 from typing import Callable
 
-from pandas import Series
+import numpy as np
+from numpy.typing import NDArray
 from toolz.functoolz import curry
 
-SmoothingFnType = Callable[[Series, Series, Series], Series]
+SmoothingFnType = Callable[[NDArray, NDArray, NDArray], NDArray]
 """Type signature for smoothing functions."""
 
 
 @curry
 def step_function(
-    encoding: Series,
-    num_samples: Series,
-    prior: Series,
+    encoding: NDArray,
+    num_samples: NDArray,
+    prior: NDArray,
     min_samples: int,
-) -> Series:
+) -> NDArray:
     """
     Step function for smoothing.
 
     Parameters
     ----------
-    encoding : Series
+    encoding : NDArray
         The current encoding.
-    num_samples : Series
+    num_samples : NDArray
         The number of samples for each category.
-    prior : Series
+    prior : NDArray
         The prior encoding.
     min_samples : int
         The minimum number of samples required to calculate the encoding.
@@ -34,24 +35,21 @@ def step_function(
 
     Returns
     -------
-    Series
+    NDArray
         The smoothed encoding.
 
     """
-    return encoding.where(
-        num_samples >= min_samples,
-        prior,
-    )
+    return np.where(num_samples >= min_samples, encoding, prior)
 
 
 @curry
 def convex_combination(
-    encoding: Series,
-    num_samples: Series,
-    prior: Series,
+    encoding: NDArray,
+    num_samples: NDArray,
+    prior: NDArray,
     x_min: int,
     x_max: int,
-) -> Series:
+) -> NDArray:
     """
     Convex combination for smoothing.
 
@@ -62,11 +60,11 @@ def convex_combination(
 
     Parameters
     ----------
-    encoding : Series
+    encoding : NDArray
         The current encoding.
-    num_samples : Series
+    num_samples : NDArray
         The number of samples for each category.
-    prior : Series
+    prior : NDArray
         The prior encoding.
     x_min : int
         The minimum number of samples required to calculate the encoding.
@@ -75,7 +73,7 @@ def convex_combination(
 
     Returns
     -------
-    Series
+    NDArray
         The smoothed encoding.
 
     """
@@ -83,5 +81,90 @@ def convex_combination(
         msg = f"{x_min=} must be less than or equal to {x_max=}"
         raise ValueError(msg)
 
-    capped_x = num_samples.clip(x_min, x_max)
+    capped_x = np.clip(num_samples, x_min, x_max)
     return prior + (encoding - prior) * (capped_x - x_min) / (x_max - x_min)
+
+
+@curry
+def logistic_function(
+    encoding: NDArray,
+    num_samples: NDArray,
+    prior: NDArray,
+    min_samples: float,
+    smoothing: float,
+) -> NDArray:
+    """
+    Logistic function for smoothing.
+
+    Weights the current encoding by a sigmoid of the number of samples,
+    centered at min_samples, and the prior encoding by its complement.
+    Lower values of smoothing make the transition sharper, approaching
+    the step function. Categories without samples use the prior encoding.
+
+    Parameters
+    ----------
+    encoding : NDArray
+        The current encoding.
+    num_samples : NDArray
+        The number of samples for each category.
+    prior : NDArray
+        The prior encoding.
+    min_samples : float
+        The number of samples at which the current encoding and the prior
+        have the same weight.
+    smoothing : float
+        The slope of the transition between the prior and the current encoding.
+
+    Returns
+    -------
+    NDArray
+        The smoothed encoding.
+
+    """
+    if smoothing <= 0:
+        msg = f"{smoothing=} must be greater than 0"
+        raise ValueError(msg)
+
+    # Sigmoid written as exp(-log(1 + exp(-x))) so it does not overflow for large |x|.
+    weight = np.exp(-np.logaddexp(0, -(num_samples - min_samples) / smoothing))
+    return np.where(num_samples > 0, prior + (encoding - prior) * weight, prior)
+
+
+@curry
+def m_estimate(
+    encoding: NDArray,
+    num_samples: NDArray,
+    prior: NDArray,
+    m: float,
+) -> NDArray:
+    """
+    M-estimate for smoothing.
+
+    Bayesian blend of the current encoding and the prior, where the prior
+    counts as m additional samples. The current encoding is weighted by
+    num_samples / (num_samples + m), so categories without samples use
+    the prior encoding.
+
+    Parameters
+    ----------
+    encoding : NDArray
+        The current encoding.
+    num_samples : NDArray
+        The number of samples for each category.
+    prior : NDArray
+        The prior encoding.
+    m : float
+        The weight of the prior, in number of samples.
+
+    Returns
+    -------
+    NDArray
+        The smoothed encoding.
+
+    """
+    if m <= 0:
+        msg = f"{m=} must be greater than 0"
+        raise ValueError(msg)
+
+    weight = num_samples / (num_samples + m)
+    return np.where(num_samples > 0, prior + (encoding - prior) * weight, prior)
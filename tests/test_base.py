@@ -1,5 +1,5 @@
 import pytest
-from pandas import DataFrame
+from pandas import Categorical, DataFrame
 from pandas.testing import assert_frame_equal
 
 from categorical_encoder.base import HierachicalCategoricalEncoder
@@ -294,3 +294,110 @@ def test_multi_column_encode_missing(simple_data):
     )
     with_encoding = encoder.transform(test_data)
     assert_frame_equal(expected, with_encoding)
+
+
+def test_multi_column_encoding_with_missing_parent():
+    data = DataFrame(
+        {
+            "column1": ["0", "0", "0", "0", "1", "1", "1", "1"],
+            "column2": ["0", "0", "1", None, "0", "0", "1", "1"],
+            "column3": ["0", "1", "0", "0", "0", "1", "0", "1"],
+            "target": [0.0, 0, 1, 1, 2, 2, 3, 3],
+        },
+    )
+    encoder = HierachicalCategoricalEncoder(
+        columns=["column1", "column2", "column3"],
+        smoothing_fn=step_function(min_samples=1),
+        agg_fn="mean",
+    )
+    encoder.fit(data, data["target"])
+
+    encoding = encoder.encoding
+    expected = DataFrame(
+        {
+            "_l0_": ["None", "None", "None", "None", "None", "None", "None"],
+            "column1": ["0", "0", "0", "1", "1", "1", "1"],
+            "column2": ["0", "0", "1", "0", "0", "1", "1"],
+            "column3": ["0", "1", "0", "0", "1", "0", "1"],
+            "__encoding__": [0.0, 0.0, 1.0, 2.0, 2.0, 3.0, 3.0],
+        },
+    )
+    assert_frame_equal(expected, encoding)
+
+    # Rows with a missing key fall back to the deepest level they match.
+    with_encoding = encoder.transform(data.drop(["target"], axis=1))
+    expected = DataFrame(
+        {
+            "column1": ["0", "0", "0", "1", "1", "1", "1", "0"],
+            "column2": ["0", "0", "1", "0", "0", "1", "1", None],
+            "column3": ["0", "1", "0", "0", "1", "0", "1", "0"],
+            "__encoding__": [0.0, 0.0, 1.0, 2.0, 2.0, 3.0, 3.0, 0.5],
+        },
+    )
+    assert_frame_equal(expected, with_encoding)
+
+
+def test_uneven_hierarchy_uses_parent_as_prior():
+    data = DataFrame(
+        {
+            "column1": ["a", "a", "a", "a", "a", "b"],
+            "column2": ["x", "x", "x", "y", "y", "z"],
+            "column3": ["p", "p", "q", "r", "r", "s"],
+            "target": [0.0, 2, 4, 6, 8, 10],
+        },
+    )
+    encoder = HierachicalCategoricalEncoder(
+        columns=["column1", "column2", "column3"],
+        smoothing_fn=step_function(min_samples=2),
+        agg_fn="mean",
+    )
+    encoder.fit(data, data["target"])
+
+    # Nodes with a single sample take the encoding of their parent,
+    # which may itself have been taken from its own parent.
+    encoding = encoder.encoding
+    expected = DataFrame(
+        {
+            "_l0_": ["None", "None", "None", "None"],
+            "column1": ["a", "a", "a", "b"],
+            "column2": ["x", "x", "y", "z"],
+            "column3": ["p", "q", "r", "s"],
+            "__encoding__": [1.0, 2.0, 7.0, 5.0],
+        },
+    )
+    assert_frame_equal(expected, encoding)
+
+
+@pytest.mark.filterwarnings("ignore:The default of observed=False:FutureWarning")
+def test_multi_column_encoding_with_categorical_columns():
+    data = DataFrame(
+        {
+            "column1": Categorical(["0", "1", "1"], categories=["0", "1", "2"]),
+            "column2": Categorical(["1", "0", "1"], categories=["0", "1"]),
+            "target": [10.0, 20, 30],
+        },
+    )
+    encoder = HierachicalCategoricalEncoder(
+        columns=["column1", "column2"],
+        smoothing_fn=step_function(min_samples=2),
+        agg_fn="mean",
+    )
+    encoder.fit(data, data["target"])
+
+    # Unobserved categories are encoded with the prior of their own parent.
+    encoding = encoder.encoding
+    expected = DataFrame(
+        {
+            "_l0_": ["None", "None", "None", "None", "None", "None"],
+            "column1": Categorical(
+                ["0", "0", "1", "1", "2", "2"],
+                categories=["0", "1", "2"],
+            ),
+            "column2": Categorical(
+                ["0", "1", "0", "1", "0", "1"],
+                categories=["0", "1"],
+            ),
+            "__encoding__": [20.0, 20.0, 25.0, 25.0, 20.0, 20.0],
+        },
+    )
+    assert_frame_equal(expected, encoding)
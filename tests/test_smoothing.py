@@ -1,9 +1,16 @@
+import numpy as np
 import pytest
+from numpy.testing import assert_allclose
 from pandas import DataFrame
 from pandas.testing import assert_frame_equal
 
 from categorical_encoder.base import HierachicalCategoricalEncoder
-from categorical_encoder.smoothing import convex_combination
+from categorical_encoder.smoothing import (
+    convex_combination,
+    logistic_function,
+    m_estimate,
+    step_function,
+)
 
 
 @pytest.fixture()
@@ -51,3 +58,109 @@ def test_convex_combination(simple_data):
     )
     with_encoding = encoder.transform(test_data)
     assert_frame_equal(expected, with_encoding)
+
+
+@pytest.fixture()
+def kernel_inputs() -> tuple:
+    encoding = np.array([0.0, 1.0, 2.0, 3.0])
+    num_samples = np.array([0, 1, 2, 10])
+    prior = np.array([1.0, 1.0, 1.0, 1.0])
+    return encoding, num_samples, prior
+
+
+def test_step_function_kernel(kernel_inputs):
+    assert_allclose(
+        step_function(*kernel_inputs, min_samples=2),
+        [1.0, 1.0, 2.0, 3.0],
+    )
+
+
+def test_convex_combination_kernel(kernel_inputs):
+    assert_allclose(
+        convex_combination(*kernel_inputs, x_min=0, x_max=2),
+        [1.0, 1.0, 2.0, 3.0],
+    )
+
+
+def test_convex_combination_invalid_range(kernel_inputs):
+    with pytest.raises(ValueError, match="x_min"):
+        convex_combination(*kernel_inputs, x_min=2, x_max=1)
+
+
+def test_logistic_function_kernel(kernel_inputs):
+    assert_allclose(
+        logistic_function(*kernel_inputs, min_samples=1, smoothing=1),
+        [1.0, 1.0, 1.0 + 1 / (1 + np.exp(-1)), 1.0 + 2 / (1 + np.exp(-9))],
+    )
+
+
+@pytest.mark.filterwarnings("error")
+def test_logistic_function_sharp_transition():
+    encoding = np.array([0.0, 3.0])
+    num_samples = np.array([1, 40])
+    prior = np.array([1.0, 1.0])
+
+    assert_allclose(
+        logistic_function(encoding, num_samples, prior, min_samples=20, smoothing=0.01),
+        [1.0, 3.0],
+    )
+
+
+def test_logistic_function_invalid_smoothing(kernel_inputs):
+    with pytest.raises(ValueError, match="smoothing"):
+        logistic_function(*kernel_inputs, min_samples=1, smoothing=0)
+
+
+def test_m_estimate_kernel(kernel_inputs):
+    assert_allclose(
+        m_estimate(*kernel_inputs, m=2),
+        [1.0, 1.0, 1.5, 1.0 + 2 * 10 / 12],
+    )
+
+
+@pytest.mark.parametrize("m", [0, -1])
+def test_m_estimate_invalid_m(kernel_inputs, m):
+    with pytest.raises(ValueError, match="m="):
+        m_estimate(*kernel_inputs, m=m)
+
+
+@pytest.mark.filterwarnings("error")
+@pytest.mark.parametrize(
+    "smoothing_fn",
+    [
+        logistic_function(min_samples=0, smoothing=1),
+        m_estimate(m=1),
+    ],
+)
+def test_blended_smoothing_without_samples(smoothing_fn):
+    encoding = np.array([np.nan, 0.0])
+    num_samples = np.array([0, 0])
+    prior = np.array([1.0, 2.0])
+
+    assert_allclose(smoothing_fn(encoding, num_samples, prior), [1.0, 2.0])
+
+
+@pytest.mark.parametrize(
+    "smoothing_fn",
+    [
+        logistic_function(min_samples=4, smoothing=1),
+        m_estimate(m=4),
+    ],
+)
+def test_blended_smoothing(simple_data, smoothing_fn):
+    encoder = HierachicalCategoricalEncoder(
+        columns=["column1"],
+        smoothing_fn=smoothing_fn,
+        agg_fn="mean",
+    )
+    encoder.fit(simple_data, simple_data["target"])
+
+    encoding = encoder.encoding
+    expected = DataFrame(
+        {
+            "_l0_": ["None", "None"],
+            "column1": ["0", "1"],
+            "__encoding__": [1.0, 2.0],
+        },
+    )
+    assert_frame_equal(expected, encoding)